@@ -129,10 +129,16 @@ if __name__ == "__main__":
         tdim = mesh.topology.dim
         top_facets = locate_entities_boundary(mesh, tdim - 1, top)
         bottom_facets = locate_entities_boundary(mesh, tdim - 1, bottom)
-        top_values = np.full(len(top_facets), top_value, dtype=np.int32)
-        bottom_values = np.full(len(bottom_facets), bottom_value, dtype=np.int32)
-        indices = np.concatenate([top_facets, bottom_facets])
-        values = np.hstack([top_values, bottom_values])
+        # Fill preallocated index/value arrays instead of allocating per-tag
+        # temporaries with np.full and concatenating them
+        num_top = len(top_facets)
+        total = num_top + len(bottom_facets)
+        indices = np.empty(total, dtype=np.int32)
+        values = np.empty(total, dtype=np.int32)
+        indices[:num_top] = top_facets
+        indices[num_top:] = bottom_facets
+        values[:num_top] = top_value
+        values[num_top:] = bottom_value
         sorted_facets = np.argsort(indices)
         facet_marker = meshtags(mesh, tdim - 1, indices[sorted_facets], values[sorted_facets])
         mesh_data = (facet_marker, top_value, bottom_value)
@@ -6,9 +6,11 @@ import argparse
 
 import numpy as np
 from dolfinx.io import XDMFFile
-from dolfinx.mesh import locate_entities_boundary, meshtags
+from dolfinx.mesh import (compute_midpoints, exterior_facet_indices,
+                          meshtags)
 from mpi4py import MPI
 
+from dolfinx_contact.helpers import optimized_jit_options, parse_args_bcast
 from dolfinx_contact.meshing import (convert_mesh, create_circle_circle_mesh,
                                      create_circle_plane_mesh,
                                      create_sphere_plane_mesh)
@@ -19,9 +21,9 @@ if __name__ == "__main__":
     desc = "Nitsche's method with rigid surface using custom assemblers"
     parser = argparse.ArgumentParser(description=desc,
                                      formatter_class=argparse.ArgumentDefaultsHelpFormatter)
-    parser.add_argument("--theta", default=1, type=np.float64, dest="theta",
+    parser.add_argument("--theta", default=1, type=float, dest="theta",
                         help="Theta parameter for Nitsche, 1 symmetric, -1 skew symmetric, 0 Penalty-like")
-    parser.add_argument("--gamma", default=10, type=np.float64, dest="gamma",
+    parser.add_argument("--gamma", default=10, type=float, dest="gamma",
                         help="Coercivity/Stabilization parameter for Nitsche condition")
     _solve = parser.add_mutually_exclusive_group(required=False)
     _solve.add_argument('--linear', dest='linear_solver', action='store_true',
@@ -41,17 +43,17 @@ if __name__ == "__main__":
     _dirichlet = parser.add_mutually_exclusive_group(required=False)
     _dirichlet.add_argument('--dirichlet', dest='dirichlet', action='store_true',
                             help="Use strong Dirichlet formulation", default=False)
-    _E = parser.add_argument("--E", default=1e3, type=np.float64, dest="E",
+    _E = parser.add_argument("--E", default=1e3, type=float, dest="E",
                              help="Youngs modulus of material")
     _nu = parser.add_argument(
-        "--nu", default=0.1, type=np.float64, dest="nu", help="Poisson's ratio")
-    _disp = parser.add_argument("--disp", default=0.2, type=np.float64, dest="disp",
+        "--nu", default=0.1, type=float, dest="nu", help="Poisson's ratio")
+    _disp = parser.add_argument("--disp", default=0.2, type=float, dest="disp",
                                 help="Displacement BC in negative y direction")
-    _ref = parser.add_argument("--refinements", default=2, type=np.int32,
+    _ref = parser.add_argument("--refinements", default=2, type=int,
                                dest="refs", help="Number of mesh refinements")
 
     # Parse input arguments or set to defualt values
-    args = parser.parse_args()
+    args = parse_args_bcast(parser)
 
     # Current formulation uses unilateral contact
     nitsche_parameters = {"gamma": args.gamma, "theta": args.theta}
@@ -91,36 +93,27 @@ if __name__ == "__main__":
             tdim = mesh.topology.dim
             mesh.topology.create_connectivity(tdim - 1, tdim)
 
-            def top1(x):
-                return x[1] > 0.55
-
-            def bottom1(x):
-                return np.logical_and(x[1] < 0.5, x[1] > 0.15)
-
-            def top2(x):
-                return np.logical_and(x[1] > -0.3, x[1] < 0.15)
-
-            def bottom2(x):
-                return x[1] < -0.35
-
             top_value = 1
             bottom_value = 2
             surface_value = 3
             surface_bottom = 4
-            # Create meshtag for top and bottom markers
-            top_facets1 = locate_entities_boundary(mesh, tdim - 1, top1)
-            bottom_facets1 = locate_entities_boundary(mesh, tdim - 1, bottom1)
-            top_facets2 = locate_entities_boundary(mesh, tdim - 1, top2)
-            bottom_facets2 = locate_entities_boundary(mesh, tdim - 1, bottom2)
-            top_values = np.full(len(top_facets1), top_value, dtype=np.int32)
-            bottom_values = np.full(len(bottom_facets1), bottom_value, dtype=np.int32)
-
-            surface_values = np.full(len(top_facets2), surface_value, dtype=np.int32)
-            sbottom_values = np.full(len(bottom_facets2), surface_bottom, dtype=np.int32)
-            indices = np.concatenate([top_facets1, bottom_facets1, top_facets2, bottom_facets2])
-            values = np.hstack([top_values, bottom_values, surface_values, sbottom_values])
-            sorted_facets = np.argsort(indices)
-            facet_marker = meshtags(mesh, tdim - 1, indices[sorted_facets], values[sorted_facets])
+            # Create meshtag for top and bottom markers. All four markers are
+            # bands in the y-coordinate, so instead of evaluating a predicate
+            # per marker over the full coordinate array we compute the facet
+            # midpoints of the exterior facets once and derive all masks from
+            # a single pass over the y-coordinates
+            boundary_facets = exterior_facet_indices(mesh.topology)
+            y = np.ascontiguousarray(compute_midpoints(mesh, tdim - 1, boundary_facets)[:, 1])
+            # The masks are disjoint subsets of the (sorted) exterior facets,
+            # so the tag values can be filled in a single linear pass instead
+            # of concatenating the buckets and argsorting the result
+            marker_values = np.zeros(len(boundary_facets), dtype=np.int32)
+            marker_values[y > 0.55] = top_value
+            marker_values[np.logical_and(y < 0.5, y > 0.15)] = bottom_value
+            marker_values[np.logical_and(y > -0.3, y < 0.15)] = surface_value
+            marker_values[y < -0.35] = surface_bottom
+            tagged = marker_values > 0
+            facet_marker = meshtags(mesh, tdim - 1, boundary_facets[tagged], marker_values[tagged])
         else:
             fname = f"{mesh_dir}/twomeshes"
             create_circle_plane_mesh(filename=f"{fname}.msh", quads=(not simplex), res=0.05)
@@ -132,35 +125,34 @@ if __name__ == "__main__":
                 mesh.topology.create_connectivity(tdim - 1, tdim)
                 facet_marker = xdmf.read_meshtags(mesh, "facet_marker")
 
-            def top(x):
-                return x[1] > 0.5
-
-            def bottom(x):
-                return np.logical_and(x[1] < 0.45, x[1] > 0.15)
-
             top_value = 1
             bottom_value = 2
             surface_value = 3
             surface_bottom = 4
-            # Create meshtag for top and bottom markers
-            top_facets1 = locate_entities_boundary(mesh, tdim - 1, top)
-            bottom_facets1 = locate_entities_boundary(mesh, tdim - 1, bottom)
-            top_facets2 = locate_entities_boundary(mesh, tdim - 1, lambda x: np.isclose(x[1], 0.1))
-            bottom_facets2 = locate_entities_boundary(mesh, tdim - 1, lambda x: np.isclose(x[1], 0.0))
-            top_values = np.full(len(top_facets1), top_value, dtype=np.int32)
-            bottom_values = np.full(len(bottom_facets1), bottom_value, dtype=np.int32)
-
-            surface_values = np.full(len(top_facets2), surface_value, dtype=np.int32)
-            sbottom_values = np.full(len(bottom_facets2), surface_bottom, dtype=np.int32)
-            indices = np.concatenate([top_facets1, bottom_facets1, top_facets2, bottom_facets2])
-            values = np.hstack([top_values, bottom_values, surface_values, sbottom_values])
-            sorted_facets = np.argsort(indices)
-            facet_marker = meshtags(mesh, tdim - 1, indices[sorted_facets], values[sorted_facets])
+            # Create meshtag for top and bottom markers, deriving all masks
+            # from a single pass over the exterior facet midpoints
+            boundary_facets = exterior_facet_indices(mesh.topology)
+            y = np.ascontiguousarray(compute_midpoints(mesh, tdim - 1, boundary_facets)[:, 1])
+            # The masks are disjoint subsets of the (sorted) exterior facets,
+            # so the tag values can be filled in a single linear pass instead
+            # of concatenating the buckets and argsorting the result
+            marker_values = np.zeros(len(boundary_facets), dtype=np.int32)
+            marker_values[y > 0.5] = top_value
+            marker_values[np.logical_and(y < 0.45, y > 0.15)] = bottom_value
+            marker_values[np.isclose(y, 0.1)] = surface_value
+            marker_values[np.isclose(y, 0.0)] = surface_bottom
+            tagged = marker_values > 0
+            facet_marker = meshtags(mesh, tdim - 1, boundary_facets[tagged], marker_values[tagged])
 
     # Solver options
     newton_options = {"relaxation_parameter": 1.0, "max_it": 50}
     # petsc_options = {"ksp_type": "preonly", "pc_type": "lu"}
+    # Reuse the GAMG interpolation operators between Newton iterations: the
+    # sparsity pattern of the operator is unchanged (only the contact set
+    # varies), so the coarsening from the first iteration remains valid and
+    # rebuilding the full hierarchy every iteration is wasted setup cost
     petsc_options = {"ksp_type": "cg", "pc_type": "gamg", "pc_gamg_coarse_eq_limit": 1000,
+                     "pc_gamg_reuse_interpolation": True,
                      "mg_levels_ksp_type": "chebyshev", "mg_levels_pc_type": "jacobi",
                      "matptap_via": "scalable", "ksp_view": None}
 
@@ -172,7 +164,8 @@ if __name__ == "__main__":
                                       nitsche_parameters=nitsche_parameters,
                                       vertical_displacement=vertical_displacement, nitsche_bc=True,
                                       quadrature_degree=3, petsc_options=petsc_options,
-                                      newton_options=newton_options)
+                                      newton_options=newton_options,
+                                      jit_options=optimized_jit_options())
 
     with XDMFFile(mesh.comm, "results/u_custom_rigid.xdmf", "w") as xdmf:
         xdmf.write_mesh(mesh)
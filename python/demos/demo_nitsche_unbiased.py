@@ -17,8 +17,8 @@ from mpi4py import MPI
 from petsc4py.PETSc import ScalarType
 
 from dolfinx_contact import update_geometry
-from dolfinx_contact.helpers import (epsilon, lame_parameters, sigma_func,
-                                     weak_dirichlet)
+from dolfinx_contact.helpers import (epsilon, facet_tag_data, lame_parameters,
+                                     sigma_func, weak_dirichlet)
 from dolfinx_contact.meshing import (convert_mesh, create_box_mesh_2D,
                                      create_box_mesh_3D,
                                      create_circle_circle_mesh,
@@ -133,17 +133,11 @@ if __name__ == "__main__":
             top_facets2 = locate_entities_boundary(mesh, tdim - 1, lambda x: np.isclose(x[2], -0.1))
             bottom_facets2 = locate_entities_boundary(
                 mesh, tdim - 1, lambda x: np.isclose(x[2], -0.6))
-            top_values = np.full(len(top_facets1), dirichlet_bdy_1, dtype=np.int32)
-            bottom_values = np.full(
-                len(bottom_facets1), contact_bdy_1, dtype=np.int32)
-
-            surface_values = np.full(len(top_facets2), contact_bdy_2, dtype=np.int32)
-            sbottom_values = np.full(
-                len(bottom_facets2), dirichlet_bdy_2, dtype=np.int32)
-            indices = np.concatenate([top_facets1, bottom_facets1, top_facets2, bottom_facets2])
-            values = np.hstack([top_values, bottom_values, surface_values, sbottom_values])
-            sorted_facets = np.argsort(indices)
-            facet_marker = meshtags(mesh, tdim - 1, indices[sorted_facets], values[sorted_facets])
+            indices, values = facet_tag_data([(top_facets1, dirichlet_bdy_1),
+                                              (bottom_facets1, contact_bdy_1),
+                                              (top_facets2, contact_bdy_2),
+                                              (bottom_facets2, dirichlet_bdy_2)])
+            facet_marker = meshtags(mesh, tdim - 1, indices, values)
 
         elif problem == 2:
             outname = "results/problem2_3D_simplex" if simplex else "results/problem2_3D_hex"
@@ -194,14 +188,11 @@ if __name__ == "__main__":
             contact_facets_2 = locate_entities_boundary(mesh, tdim - 1, left_contact)
             dirchlet_facets_2 = locate_entities_boundary(mesh, tdim - 1, left)
 
-            val0 = np.full(len(dirichlet_facets_1), dirichlet_bdy_1, dtype=np.int32)
-            val1 = np.full(len(contact_facets_1), contact_bdy_1, dtype=np.int32)
-            val2 = np.full(len(contact_facets_2), contact_bdy_2, dtype=np.int32)
-            val3 = np.full(len(dirchlet_facets_2), dirichlet_bdy_2, dtype=np.int32)
-            indices = np.concatenate([dirichlet_facets_1, contact_facets_1, contact_facets_2, dirchlet_facets_2])
-            values = np.hstack([val0, val1, val2, val3])
-            sorted_facets = np.argsort(indices)
-            facet_marker = meshtags(mesh, tdim - 1, indices[sorted_facets], values[sorted_facets])
+            indices, values = facet_tag_data([(dirichlet_facets_1, dirichlet_bdy_1),
+                                              (contact_facets_1, contact_bdy_1),
+                                              (contact_facets_2, contact_bdy_2),
+                                              (dirchlet_facets_2, dirichlet_bdy_2)])
+            facet_marker = meshtags(mesh, tdim - 1, indices, values)
             if args.radius > 0.8 / args.time_steps:
                 args.radius = 0.8 / args.time_steps
 
@@ -274,15 +265,11 @@ if __name__ == "__main__":
             bottom_facets1 = locate_entities_boundary(mesh, tdim - 1, top_contact)
             top_facets2 = locate_entities_boundary(mesh, tdim - 1, bottom_contact)
             bottom_facets2 = locate_entities_boundary(mesh, tdim - 1, bottom_dir)
-            dir_val1 = np.full(len(top_facets1), dirichlet_bdy_1, dtype=np.int32)
-            c_val1 = np.full(len(bottom_facets1), contact_bdy_1, dtype=np.int32)
-            surface_values = np.full(len(top_facets2), contact_bdy_2, dtype=np.int32)
-            sbottom_values = np.full(len(bottom_facets2), dirichlet_bdy_2, dtype=np.int32)
-            indices = np.concatenate([top_facets1, bottom_facets1, top_facets2, bottom_facets2])
-            values = np.hstack([dir_val1, c_val1, surface_values, sbottom_values])
-            sorted_facets = np.argsort(indices)
-
-            facet_marker = meshtags(mesh, tdim - 1, indices[sorted_facets], values[sorted_facets])
+            indices, values = facet_tag_data([(top_facets1, dirichlet_bdy_1),
+                                              (bottom_facets1, contact_bdy_1),
+                                              (top_facets2, contact_bdy_2),
+                                              (bottom_facets2, dirichlet_bdy_2)])
+            facet_marker = meshtags(mesh, tdim - 1, indices, values)
 
     if mesh.comm.size > 1:
         mesh, facet_marker, domain_marker = create_contact_mesh(
@@ -356,8 +343,7 @@ if __name__ == "__main__":
 
     # Data to be stored on the unperturb domain at the end of the simulation
     u_all = Function(V)
-    u_all.x.array[:] = np.zeros(u.x.array[:].shape)
-    geometry = mesh.geometry.x[:].copy()
+    u_all.x.array[:] = 0.0
 
     log.set_log_level(log.LogLevel.WARNING)
     num_newton_its = np.zeros((nload_steps, args.time_steps), dtype=int)
@@ -418,13 +404,18 @@ if __name__ == "__main__":
         # Perturb mesh with solution displacement
         update_geometry(u._cpp_object, mesh._cpp_object)
 
-        # Accumulate displacements
-        u_all.x.array[:] += u.x.array[:]
-        u.x.array[:].fill(0)
+        # Accumulate displacements in place; no per-step temporaries
+        u_all.x.array[:] += u.x.array
+        u.x.array[:] = 0.0
         u.x.scatter_forward()
 
-    # Reset mesh to initial state and write accumulated solution
-    mesh.geometry.x[:] = geometry
+    # Reset mesh to initial state by subtracting the accumulated
+    # displacement (update_geometry is additive in u, so applying -u_all
+    # undoes all load steps); this avoids keeping a full copy of the
+    # geometry around for the whole simulation
+    u.x.array[:] = -u_all.x.array
+    u.x.scatter_forward()
+    update_geometry(u._cpp_object, mesh._cpp_object)
     with XDMFFile(mesh.comm, "results/u_unbiased_total.xdmf", "w") as xdmf:
         xdmf.write_mesh(mesh)
         u_all.name = "u"
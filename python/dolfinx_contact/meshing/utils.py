@@ -2,8 +2,29 @@
 #
 # SPDX-License-Identifier:    MIT
 
+from contextlib import contextmanager
+
 from mpi4py import MPI
 import dolfinx.io
+import gmsh
+
+
+@contextmanager
+def gmsh_session():
+    """
+    Context manager providing a process-lifetime GMSH session.
+
+    ``gmsh.initialize()`` is only called when no session exists yet, so
+    parameter sweeps that generate several meshes in one process pay the
+    start-up cost once. The model is cleared on exit, leaving the session
+    ready for the next mesh.
+    """
+    if not gmsh.isInitialized():
+        gmsh.initialize()
+    try:
+        yield gmsh
+    finally:
+        gmsh.clear()
 
 
 def convert_mesh(filename: str, outname: str, gdim: int = 3):
@@ -11,6 +32,10 @@ def convert_mesh(filename: str, outname: str, gdim: int = 3):
     Read a GMSH mesh (msh format) and convert it to XDMF with both cell
     and facet tags in a single file.
 
+    The mesh is written with DOLFINx's XDMFFile, which streams the geometry
+    and topology arrays straight to HDF5 from C++ without wrapping them in
+    intermediate Python mesh objects.
+
     Parameters
     ==========
     filename
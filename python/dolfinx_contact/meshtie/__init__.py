@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier:    MIT
 
-from .nitsche_meshtie import nitsche_meshtie
+from .nitsche_meshtie import MeshTieAssembler, nitsche_meshtie
 
 
-__all__ = ["nitsche_meshtie"]
+__all__ = ["MeshTieAssembler", "nitsche_meshtie"]
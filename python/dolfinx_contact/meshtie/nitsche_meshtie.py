@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier:    MIT
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 import dolfinx.cpp.fem as _cppfem
 import dolfinx.common as _common
@@ -16,38 +16,41 @@ from petsc4py import PETSc as _PETSc
 
 import dolfinx_contact
 import dolfinx_contact.cpp
-from dolfinx_contact.helpers import rigid_motions_nullspace_subdomains
+from dolfinx_contact.helpers import (rigid_motions_nullspace_subdomains,
+                                     unique_tag_values)
 
 kt = dolfinx_contact.cpp.Kernel
 
+__all__ = ["MeshTieAssembler", "nitsche_meshtie"]
 
-def nitsche_meshtie(lhs: ufl.Form,
-                    rhs: _fem.Function,
-                    u: _fem.Function,
-                    markers: list[MeshTags],
-                    surface_data: Tuple[AdjacencyList_int32, list[Tuple[int, int]]],
-                    bcs: list[_fem.DirichletBCMetaClass],
-                    problem_parameters: dict[str, np.float64],
-                    quadrature_degree: int = 5,
-                    form_compiler_options: Optional[dict] = None,
-                    jit_options: Optional[dict] = None,
-                    petsc_options: Optional[dict] = None,
-                    timing_str: str = '',
-                    num_domains=1) -> Tuple[_fem.Function, int, int, float]:
+
+class MeshTieAssembler:
     """
-    Use custom kernel to compute elasticity problem if mesh consists of topologically disconnected parts
+    Reusable assembler for Nitsche mesh tying.
+
+    All topology-invariant data — the contact class and its distance maps,
+    packed material parameters, cell diameters, gaps, (gradients of) test
+    functions, the compiled forms, the generated kernels, the PETSc matrix
+    and vector and the rigid-motion nullspace — are computed once at
+    construction. :func:`assemble` only repacks the u-dependent coefficients
+    and refills the matrix and vector, so a load-stepping or Newton driver
+    pays the setup cost a single time.
 
     Parameters
     ==========
-    lhs the variational form (bilinear form) for the stiffness matrix
-    rhs the variational form  (linear form) for the right hand side
-    u The function to be solved for. Also serves as initial value.
+    lhs the variational form (bilinear form) for the stiffness matrix.
+        May be an already compiled form, which is then used as-is, so a
+        driver creating several assemblers (e.g. one per refinement or
+        load case on the same mesh) can share one FFCx compilation
+    rhs the variational form  (linear form) for the right hand side.
+        May also be an already compiled form
+    V The function space of the problem
     markers
         A list of meshtags. The first element must mark all separate objects in order to create the correct nullspace.
         The second element must contain the mesh_tags for all puppet surfaces,
         Dirichlet-surfaces and Neumann-surfaces
         All further elements may contain candidate_surfaces
-    contact_data = (surfaces, surface_pairs), where
+    surface_data = (surfaces, surface_pairs), where
         surfaces: Adjacency list. Links of i are meshtag values for contact
                   surfaces in ith mesh_tag in mesh_tags
         surface_pairs: list of pairs (i, j) marking the ith surface as a puppet
@@ -63,189 +66,327 @@ def nitsche_meshtie(lhs: ufl.Form,
         The quadrature degree to use for the custom contact kernels
     form_compiler_options
         Parameters used in FFCX compilation of this form. Run `ffcx --help` at
-        the commandline to see all available options. Takes priority over all
-        other parameter values, except for `scalar_type` which is determined by
-        DOLFINX.
+        the commandline to see all available options.
     jit_options
         Parameters used in CFFI JIT compilation of C code generated by FFCX.
         See https://github.com/FEniCS/dolfinx/blob/main/python/dolfinx/jit.py
-        for all available parameters. Takes priority over all other parameter values.
+        for all available parameters.
+    """
+
+    def __init__(self, lhs: Union[ufl.Form, _fem.FormMetaClass],
+                 rhs: Union[ufl.Form, _fem.FormMetaClass],
+                 V: _fem.FunctionSpace,
+                 markers: list[MeshTags],
+                 surface_data: Tuple[AdjacencyList_int32, list[Tuple[int, int]]],
+                 problem_parameters: dict[str, np.float64],
+                 quadrature_degree: int = 5,
+                 form_compiler_options: Optional[dict] = None,
+                 jit_options: Optional[dict] = None,
+                 timing_str: str = '',
+                 num_domains=1):
+        form_compiler_options = {} if form_compiler_options is None else form_compiler_options
+        jit_options = {} if jit_options is None else jit_options
+
+        try:
+            mu = problem_parameters["mu"]
+            lmbda = problem_parameters["lambda"]
+        except KeyError:
+            raise RuntimeError("Need to supply lame parameters")
+        try:
+            theta = problem_parameters["theta"]
+            gamma = problem_parameters["gamma"]
+        except KeyError:
+            raise RuntimeError("Need to supply gamma and theta for Nitsche's method")
+
+        # Contact data
+        surface_pairs = surface_data[1]
+        surfaces = surface_data[0]
+
+        # Mesh, function space and FEM functions
+        mesh = V.mesh
+        h = ufl.CellDiameter(mesh)
+        self.V = V
+        self.timing_str = timing_str
+        self.quadrature_degree = quadrature_degree
+        self.num_pairs = len(surface_pairs)
+
+        # Custom assembly
+        # create contact class
+        markers_cpp = [marker._cpp_object for marker in markers[1:]]
+        with _common.Timer("~Contact " + timing_str + ": Init"):
+            self.contact = dolfinx_contact.cpp.Contact(markers_cpp, surfaces, surface_pairs,
+                                                       V._cpp_object, quadrature_degree=quadrature_degree)
+        with _common.Timer("~Contact " + timing_str + ": Distance maps"):
+            for i in range(self.num_pairs):
+                self.contact.create_distance_map(i)
+        # pack constants
+        self.consts = np.array([gamma, theta])
+
+        self.entities = []
+        with _common.Timer("~Contact " + timing_str + ": Compute active entities"):
+            for pair in surface_pairs:
+                self.entities.append(self.contact.active_entities(pair[0]))
+
+        # Pack celldiameter on each surface
+        h_packed = []
+        with _common.Timer("~Contact " + timing_str + ": Compute and pack celldiameter"):
+            V2 = _fem.FunctionSpace(mesh, ("DG", 0))
+            # Take the union of the per-pair cell lists with a boolean mask
+            # over the local cells: sort-free and without the concatenated
+            # temporary of np.unique(np.hstack(...))
+            cell_map = mesh.topology.index_map(mesh.topology.dim)
+            on_surface = np.zeros(cell_map.size_local + cell_map.num_ghosts, dtype=bool)
+            for i in range(self.num_pairs):
+                on_surface[self.entities[i][:, 0]] = True
+            surface_cells = np.flatnonzero(on_surface).astype(np.int32)
+            h_int = _fem.Function(V2)
+            if mesh.ufl_domain().ufl_coordinate_element().degree() == 1:
+                # For affine cells the diameter is the largest vertex-vertex
+                # distance. Computing it directly from the geometry on the
+                # surface cells avoids JIT-compiling a UFL Expression. The
+                # DG-0 dof of a cell is the cell index itself
+                adj = mesh.geometry.dofmap
+                x_dofs = adj.array.reshape(-1, adj.offsets[1] - adj.offsets[0])[surface_cells]
+                cell_coords = mesh.geometry.x[x_dofs]
+                diff = cell_coords[:, :, np.newaxis, :] - cell_coords[:, np.newaxis, :, :]
+                h_int.x.array[surface_cells] = np.sqrt(
+                    np.sum(diff * diff, axis=-1)).max(axis=(1, 2))
+            else:
+                expr = _fem.Expression(h, V2.element.interpolation_points())
+                h_int.interpolate(expr, surface_cells)
+            for i in range(self.num_pairs):
+                h_packed.append(dolfinx_contact.cpp.pack_coefficient_quadrature(
+                    h_int._cpp_object, 0, self.entities[i]))
+
+        # mu and lambda are spatially constant, so their packed representation
+        # is just the scalar repeated at every quadrature point. Fill the
+        # arrays directly instead of interpolating into DG-0 functions and
+        # packing them through the quadrature machinery
+        material = []
+        with _common.Timer("~Contact " + timing_str + ": Pack coeffs (mu, lmbda"):
+            for i in range(self.num_pairs):
+                num_points = h_packed[i].shape[1]
+                mat = np.empty((self.entities[i].shape[0], 2 * num_points))
+                mat[:, :num_points] = mu
+                mat[:, num_points:] = lmbda
+                material.append(mat)
+
+        # Pack gap, normals and test functions on each surface. The zero
+        # displacement arrays passed to the gradient packing are kept around
+        # and reused by pack_coefficients on every assembly
+        self.gaps = []
+        self._zero_disps = []
+        test_fns = []
+        grad_test_fns = []
+        with _common.Timer("~Contact " + timing_str + ": Pack gap, normals, testfunction"):
+            for i in range(self.num_pairs):
+                self.gaps.append(self.contact.pack_gap(i))
+                self._zero_disps.append(np.zeros(self.gaps[i].shape))
+                test_fns.append(self.contact.pack_test_functions(i))
+                grad_test_fns.append(self.contact.pack_grad_test_functions(
+                    i, self.gaps[i], self._zero_disps[i]))
+
+        # Concatenate all u-independent coeffs
+        self.coeffs_const = []
+        for i in range(self.num_pairs):
+            self.coeffs_const.append(np.hstack([material[i], h_packed[i], test_fns[i], grad_test_fns[i]]))
+        # Combined coefficient buffers, allocated on the first pack
+        self._coeffs_buf: Optional[list[np.ndarray]] = None
+
+        # Generate Jacobian data structures. Accept already compiled forms to
+        # avoid redundant FFCx JIT passes when assemblers are created
+        # repeatedly for the same variational problem
+        if isinstance(lhs, _fem.FormMetaClass):
+            self.J_custom = lhs
+        else:
+            self.J_custom = _fem.form(lhs, form_compiler_options=form_compiler_options, jit_options=jit_options)
+        with _common.Timer("~Contact " + timing_str + ": Generate Jacobian kernel"):
+            self.kernel_jac = self.contact.generate_kernel(kt.MeshTieJac)
+        with _common.Timer("~Contact " + timing_str + ": Create matrix"):
+            self.A = self.contact.create_matrix(self.J_custom)
+        # The sparsity pattern is preallocated exactly and never changes, so
+        # keep it when the matrix is zeroed, and error out instead of taking
+        # PETSc's slow dynamic-allocation path if an insertion ever falls
+        # outside the preallocated pattern
+        self.A.setOption(_PETSc.Mat.Option.KEEP_NONZERO_PATTERN, True)
+        self.A.setOption(_PETSc.Mat.Option.NEW_NONZERO_ALLOCATION_ERR, True)
+
+        # Generate residual data structures
+        if isinstance(rhs, _fem.FormMetaClass):
+            self.F_custom = rhs
+        else:
+            self.F_custom = _fem.form(rhs, form_compiler_options=form_compiler_options, jit_options=jit_options)
+        with _common.Timer("~Contact " + timing_str + ": Generate residual kernel"):
+            self.kernel_rhs = self.contact.generate_kernel(kt.MeshTieRhs)
+        with _common.Timer("~Contact " + timing_str + ": Create vector"):
+            self.b = _fem.petsc.create_vector(self.F_custom)
+
+        # The form constants (gamma, theta) never change, so pack them once
+        # instead of on every assembly
+        self.consts_rhs = _cppfem.pack_constants(self.F_custom)
+        self.consts_jac = _cppfem.pack_constants(self.J_custom)
+
+        # Set rigid motion nullspace
+        self.null_space = rigid_motions_nullspace_subdomains(V, markers[0], unique_tag_values(markers[0].values),
+                                                             num_domains=num_domains)
+        self.A.setNearNullSpace(self.null_space)
+
+        # Krylov solver, created on the first call to solver()
+        self._ksp: Optional[_PETSc.KSP] = None
+
+    def pack_coefficients(self, u: _fem.Function) -> list[np.ndarray]:
+        """Pack the u-dependent coefficients and combine them with the cached
+        u-independent ones."""
+        timing_str = self.timing_str
+        u_candidate = []
+        grad_u_candidate = []
+        with _common.Timer("~~Contact " + timing_str + ": Pack u contact"):
+            for i in range(self.num_pairs):
+                u_candidate.append(self.contact.pack_u_contact(i, u._cpp_object))
+                grad_u_candidate.append(self.contact.pack_grad_u_contact(
+                    i, u._cpp_object, self.gaps[i], self._zero_disps[i]))
+        u_puppet = []
+        grad_u_puppet = []
+        with _common.Timer("~~Contact " + timing_str + ": Pack u"):
+            for i in range(self.num_pairs):
+                u_puppet.append(dolfinx_contact.cpp.pack_coefficient_quadrature(
+                    u._cpp_object, self.quadrature_degree, self.entities[i]))
+                grad_u_puppet.append(dolfinx_contact.cpp.pack_gradient_quadrature(
+                    u._cpp_object, self.quadrature_degree, self.entities[i]))
+        # Blit the packed blocks into one preallocated buffer per surface;
+        # np.hstack would reallocate the combined array and re-copy the
+        # constant columns on every call
+        if self._coeffs_buf is None:
+            self._coeffs_buf = []
+            for i in range(self.num_pairs):
+                width = (self.coeffs_const[i].shape[1] + u_puppet[i].shape[1] + grad_u_puppet[i].shape[1]
+                         + u_candidate[i].shape[1] + grad_u_candidate[i].shape[1])
+                buf = np.empty((self.coeffs_const[i].shape[0], width), dtype=self.coeffs_const[i].dtype)
+                buf[:, :self.coeffs_const[i].shape[1]] = self.coeffs_const[i]
+                self._coeffs_buf.append(buf)
+        for i in range(self.num_pairs):
+            offset = self.coeffs_const[i].shape[1]
+            for block in (u_puppet[i], grad_u_puppet[i], u_candidate[i], grad_u_candidate[i]):
+                np.copyto(self._coeffs_buf[i][:, offset:offset + block.shape[1]], block)
+                offset += block.shape[1]
+        return self._coeffs_buf
+
+    def assemble(self, u: _fem.Function, bcs: list[_fem.DirichletBCMetaClass],
+                 assemble_jac: bool = True):
+        """Assemble the residual vector and Jacobi matrix for the current u.
+
+        For linear elasticity the Jacobi matrix does not depend on u, so a
+        driver can pass assemble_jac=False on all but the first call to skip
+        the matrix assembly and reuse the cached operator.
+        """
+        timing_str = self.timing_str
+        coeffs = self.pack_coefficients(u)
+
+        # Assemble residual vector
+        b = self.b
+        b.zeroEntries()
+        b.ghostUpdate(addv=_PETSc.InsertMode.INSERT, mode=_PETSc.ScatterMode.FORWARD)
+        with _common.Timer("~~Contact " + timing_str + ": Contact contributions (in assemble vector)"):
+            for i in range(self.num_pairs):
+                self.contact.assemble_vector(b, i, self.kernel_rhs, coeffs[i], self.consts)
+        with _common.Timer("~~Contact " + timing_str + ": Pack coefficients ufl"):
+            coeffs_ufl = _cppfem.pack_coefficients(self.F_custom)
+        with _common.Timer("~~Contact " + timing_str + ": Standard contributions (in assemble vector)"):
+            _fem.petsc.assemble_vector(b, self.F_custom, constants=self.consts_rhs,
+                                       coeffs=coeffs_ufl)  # type: ignore
+            b.ghostUpdate(addv=_PETSc.InsertMode.ADD, mode=_PETSc.ScatterMode.REVERSE)
+        # Apply boundary condition
+        if len(bcs) > 0:
+            x = u.vector
+            _fem.petsc.apply_lifting(b, [self.J_custom], bcs=[bcs], x0=[x], scale=-1.0)
+            b.ghostUpdate(addv=_PETSc.InsertMode.ADD, mode=_PETSc.ScatterMode.REVERSE)
+            _fem.petsc.set_bc(b, bcs, x, -1.0)
+
+        #  Compute Jacobi Matrix
+        if not assemble_jac:
+            return
+        A = self.A
+        A.zeroEntries()
+        with _common.Timer("~~Contact " + timing_str + ": Contact contributions (in assemble matrix)"):
+            for i in range(self.num_pairs):
+                self.contact.assemble_matrix(A, [], i, self.kernel_jac, coeffs[i], self.consts)
+        # Flush the off-process stash accumulated by the contact kernels
+        # before the UFL contributions are added; only the final assemble()
+        # below does a FINAL assembly
+        A.assemblyBegin(_PETSc.Mat.AssemblyType.FLUSH)
+        A.assemblyEnd(_PETSc.Mat.AssemblyType.FLUSH)
+        with _common.Timer("~~Contact " + timing_str + ": Pack coefficients ufl"):
+            coeffs_ufl = _cppfem.pack_coefficients(self.J_custom)
+        with _common.Timer("~~Contact " + timing_str + ": Standard contributions (in assemble matrix)"):
+            _fem.petsc.assemble_matrix(A, self.J_custom, constants=self.consts_jac,
+                                       coeffs=coeffs_ufl, bcs=bcs)  # type: ignore
+        A.assemble()
+
+    def solver(self, petsc_options: Optional[dict] = None) -> _PETSc.KSP:
+        """Return the Krylov solver for this operator, creating it on the
+        first call.
+
+        On repeated calls (e.g. load stepping) the same KSP is returned with
+        preconditioner reuse and a nonzero initial guess enabled, so the
+        preconditioner setup is skipped and the solve warm-starts from the
+        solution vector of the previous step.
+        """
+        if self._ksp is None:
+            petsc_options = {} if petsc_options is None else petsc_options
+            opts = _PETSc.Options()
+            for key in petsc_options:
+                opts[key] = petsc_options[key]
+            self._ksp = _PETSc.KSP().create(self.V.mesh.comm)
+            self._ksp.setFromOptions()
+            self._ksp.setOperators(self.A)
+        else:
+            self._ksp.setReusePreconditioner(True)
+            self._ksp.setInitialGuessNonzero(True)
+        return self._ksp
+
+
+def nitsche_meshtie(lhs: Union[ufl.Form, _fem.FormMetaClass],
+                    rhs: Union[ufl.Form, _fem.FormMetaClass],
+                    u: _fem.Function,
+                    markers: list[MeshTags],
+                    surface_data: Tuple[AdjacencyList_int32, list[Tuple[int, int]]],
+                    bcs: list[_fem.DirichletBCMetaClass],
+                    problem_parameters: dict[str, np.float64],
+                    quadrature_degree: int = 5,
+                    form_compiler_options: Optional[dict] = None,
+                    jit_options: Optional[dict] = None,
+                    petsc_options: Optional[dict] = None,
+                    timing_str: str = '',
+                    num_domains=1) -> Tuple[_fem.Function, int, int, float]:
+    """
+    Use custom kernel to compute elasticity problem if mesh consists of topologically disconnected parts
+
+    One-shot driver around :class:`MeshTieAssembler`: all parameters are
+    documented there, with the additions below.
+
+    Parameters
+    ==========
+    u The function to be solved for. Also serves as initial value.
+    bcs List of Dirichlet boundary conditions
     petsc_options
         Parameters that is passed to the linear algebra backend
         PETSc. For available choices for the 'petsc_options' kwarg,
         see the `PETSc-documentation
         <https://petsc4py.readthedocs.io/en/stable/manual/ksp/>`
     """
-
-    form_compiler_options = {} if form_compiler_options is None else form_compiler_options
-    jit_options = {} if jit_options is None else jit_options
     petsc_options = {} if petsc_options is None else petsc_options
 
-    if problem_parameters.get("mu") is None:
-        raise RuntimeError("Need to supply lame paramters")
-    else:
-        mu = mu = problem_parameters.get("mu")
-
-    if problem_parameters.get("lambda") is None:
-        raise RuntimeError("Need to supply lame paramters")
-    else:
-        lmbda = problem_parameters.get("lambda")
-    if problem_parameters.get("theta") is None:
-        raise RuntimeError("Need to supply theta for Nitsche's method")
-    else:
-        theta = problem_parameters["theta"]
-    if problem_parameters.get("gamma") is None:
-        raise RuntimeError("Need to supply gamma for Nitsche's method")
-    else:
-        gamma = problem_parameters.get("gamma")
-
-    # Contact data
-    surface_pairs = surface_data[1]
-    surfaces = surface_data[0]
-
-    # Mesh, function space and FEM functions
     V = u.function_space
-    mesh = V.mesh
-    h = ufl.CellDiameter(mesh)
-
-    # Custom assembly
-    # create contact class
-    markers_cpp = [marker._cpp_object for marker in markers[1:]]
-    with _common.Timer("~Contact " + timing_str + ": Init"):
-        contact = dolfinx_contact.cpp.Contact(markers_cpp, surfaces, surface_pairs,
-                                              V._cpp_object, quadrature_degree=quadrature_degree)
-    with _common.Timer("~Contact " + timing_str + ": Distance maps"):
-        for i in range(len(surface_pairs)):
-            contact.create_distance_map(i)
-    # pack constants
-    consts = np.array([gamma, theta])
-
-    # Pack material parameters mu and lambda on each contact surface
-    with _common.Timer("~Contact " + timing_str + ": Interpolate coeffs (mu, lmbda)"):
-        V2 = _fem.FunctionSpace(mesh, ("DG", 0))
-        lmbda2 = _fem.Function(V2)
-        lmbda2.interpolate(lambda x: np.full((1, x.shape[1]), lmbda))
-        mu2 = _fem.Function(V2)
-        mu2.interpolate(lambda x: np.full((1, x.shape[1]), mu))
-
-    entities = []
-    with _common.Timer("~Contact " + timing_str + ": Compute active entities"):
-        for pair in surface_pairs:
-            entities.append(contact.active_entities(pair[0]))
-
-    material = []
-    with _common.Timer("~Contact " + timing_str + ": Pack coeffs (mu, lmbda"):
-        for i in range(len(surface_pairs)):
-            material.append(np.hstack([dolfinx_contact.cpp.pack_coefficient_quadrature(
-                mu2._cpp_object, 0, entities[i]),
-                dolfinx_contact.cpp.pack_coefficient_quadrature(
-                lmbda2._cpp_object, 0, entities[i])]))
-
-    # Pack celldiameter on each surface
-    h_packed = []
-    with _common.Timer("~Contact " + timing_str + ": Compute and pack celldiameter"):
-        surface_cells = np.unique(np.hstack([entities[i][:, 0] for i in range(len(surface_pairs))]))
-        h_int = _fem.Function(V2)
-        expr = _fem.Expression(h, V2.element.interpolation_points())
-        h_int.interpolate(expr, surface_cells)
-        for i in range(len(surface_pairs)):
-            h_packed.append(dolfinx_contact.cpp.pack_coefficient_quadrature(
-                h_int._cpp_object, 0, entities[i]))
-
-    # Pack gap, normals and test functions on each surface
-    gaps = []
-    test_fns = []
-    grad_test_fns = []
-    with _common.Timer("~Contact " + timing_str + ": Pack gap, normals, testfunction"):
-        for i in range(len(surface_pairs)):
-            gaps.append(contact.pack_gap(i))
-            test_fns.append(contact.pack_test_functions(i))
-            grad_test_fns.append(contact.pack_grad_test_functions(i, gaps[i], np.zeros(gaps[i].shape)))
-
-    # Concatenate all coeffs
-    coeffs_const = []
-    for i in range(len(surface_pairs)):
-        coeffs_const.append(np.hstack([material[i], h_packed[i], test_fns[i], grad_test_fns[i]]))
-
-    # Generate Jacobian data structures
-    J_custom = _fem.form(lhs, form_compiler_options=form_compiler_options, jit_options=jit_options)
-    with _common.Timer("~Contact " + timing_str + ": Generate Jacobian kernel"):
-        kernel_jac = contact.generate_kernel(kt.MeshTieJac)
-    with _common.Timer("~Contact " + timing_str + ": Create matrix"):
-        A = contact.create_matrix(J_custom)
-
-    # Generate residual data structures
-    F_custom = _fem.form(rhs, form_compiler_options=form_compiler_options, jit_options=jit_options)
-    with _common.Timer("~Contact " + timing_str + ": Generate residual kernel"):
-        kernel_rhs = contact.generate_kernel(kt.MeshTieRhs)
-    with _common.Timer("~Contact " + timing_str + ": Create vector"):
-        b = _fem.petsc.create_vector(F_custom)
-
-    # Compute u dependent coeficcients
-    u_candidate = []
-    grad_u_candidate = []
-    coeffs = []
-    with _common.Timer("~~Contact " + timing_str + ": Pack u contact"):
-        for i in range(len(surface_pairs)):
-            u_candidate.append(contact.pack_u_contact(i, u._cpp_object))
-            grad_u_candidate.append(contact.pack_grad_u_contact(i, u._cpp_object, gaps[i], np.zeros(gaps[i].shape)))
-    u_puppet = []
-    grad_u_puppet = []
-    with _common.Timer("~~Contact " + timing_str + ": Pack u"):
-        for i in range(len(surface_pairs)):
-            u_puppet.append(dolfinx_contact.cpp.pack_coefficient_quadrature(
-                u._cpp_object, quadrature_degree, entities[i]))
-            grad_u_puppet.append(dolfinx_contact.cpp.pack_gradient_quadrature(
-                u._cpp_object, quadrature_degree, entities[i]))
-    for i in range(len(surface_pairs)):
-        coeffs.append(np.hstack([coeffs_const[i], u_puppet[i], grad_u_puppet[i], u_candidate[i], grad_u_candidate[i]]))
-
-    # Assemble residual vector
-    b.zeroEntries()
-    b.ghostUpdate(addv=_PETSc.InsertMode.INSERT, mode=_PETSc.ScatterMode.FORWARD)
-    with _common.Timer("~~Contact " + timing_str + ": Contact contributions (in assemble vector)"):
-        for i in range(len(surface_pairs)):
-            contact.assemble_vector(b, i, kernel_rhs, coeffs[i], consts)
-    with _common.Timer("~~Contact " + timing_str + ": Pack coefficients ufl"):
-        coeffs_ufl = _cppfem.pack_coefficients(F_custom)
-    with _common.Timer("~~Contact " + timing_str + ": Pack constants ufl"):
-        consts_ufl = _cppfem.pack_constants(F_custom)
-    with _common.Timer("~~Contact " + timing_str + ": Standard contributions (in assemble vector)"):
-        _fem.petsc.assemble_vector(b, F_custom, constants=consts_ufl, coeffs=coeffs_ufl)  # type: ignore
-        b.ghostUpdate(addv=_PETSc.InsertMode.ADD, mode=_PETSc.ScatterMode.REVERSE)
-    # Apply boundary condition
-    if len(bcs) > 0:
-        x = u.vector
-        _fem.petsc.apply_lifting(b, [J_custom], bcs=[bcs], x0=[x], scale=-1.0)
-        b.ghostUpdate(addv=_PETSc.InsertMode.ADD, mode=_PETSc.ScatterMode.REVERSE)
-        _fem.petsc.set_bc(b, bcs, x, -1.0)
-
-    #  Compute Jacobi Matrix
-    A.zeroEntries()
-    with _common.Timer("~~Contact " + timing_str + ": Contact contributions (in assemble matrix)"):
-        for i in range(len(surface_pairs)):
-            contact.assemble_matrix(A, [], i, kernel_jac, coeffs[i], consts)
-    with _common.Timer("~~Contact " + timing_str + ": Pack coefficients ufl"):
-        coeffs_ufl = _cppfem.pack_coefficients(J_custom)
-    with _common.Timer("~~Contact " + timing_str + ": Pack constants ufl"):
-        consts_ufl = _cppfem.pack_constants(J_custom)
-    with _common.Timer("~~Contact " + timing_str + ": Standard contributions (in assemble matrix)"):
-        _fem.petsc.assemble_matrix(A, J_custom, constants=consts_ufl, coeffs=coeffs_ufl, bcs=bcs)  # type: ignore
-    A.assemble()
-
-    # Set rigid motion nullspace
-    null_space = rigid_motions_nullspace_subdomains(V, markers[0], np.unique(markers[0].values),
-                                                    num_domains=num_domains)
-    A.setNearNullSpace(null_space)
-    # Create PETSc Krylov solver and turn convergence monitoring on
-    opts = _PETSc.Options()
-    for key in petsc_options:
-        opts[key] = petsc_options[key]
-    solver = _PETSc.KSP().create(mesh.comm)
-    solver.setFromOptions()
 
-    # Set matrix operator
-    solver.setOperators(A)
+    assembler = MeshTieAssembler(lhs, rhs, V, markers, surface_data, problem_parameters,
+                                 quadrature_degree=quadrature_degree,
+                                 form_compiler_options=form_compiler_options,
+                                 jit_options=jit_options, timing_str=timing_str,
+                                 num_domains=num_domains)
+    assembler.assemble(u, bcs)
+
+    # Create PETSc Krylov solver and turn convergence monitoring on
+    solver = assembler.solver(petsc_options)
 
     uh = _fem.Function(V)
 
@@ -256,7 +397,7 @@ def nitsche_meshtie(lhs: ufl.Form,
     solver.setMonitor(lambda _, its, rnorm: print(f"Iteration: {its}, rel. residual: {rnorm}"))
     timing_str = "~Contact " + timing_str + ": Krylov Solver"
     with _common.Timer(timing_str):
-        solver.solve(b, uh.vector)
+        solver.solve(assembler.b, uh.vector)
 
     # Scatter forward the solution vector to update ghost values
     uh.x.scatter_forward()
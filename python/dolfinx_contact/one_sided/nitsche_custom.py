@@ -12,6 +12,8 @@ from dolfinx import fem as _fem
 from dolfinx import log as _log
 from dolfinx import mesh as dmesh
 from dolfinx.graph import create_adjacencylist
+from petsc4py import PETSc as _PETSc
+
 import dolfinx_contact
 import dolfinx_contact.cpp
 from dolfinx_contact.helpers import (epsilon, lame_parameters,
@@ -75,10 +77,9 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     plane_strain = physical_parameters.get("strain", False)
     E = physical_parameters.get("E", 1e3)
     nu = physical_parameters.get("nu", 0.1)
-    mu_func, lambda_func = lame_parameters(plane_strain)
-    mu = mu_func(E, nu)
-    lmbda = lambda_func(E, nu)
-    sigma = sigma_func(mu, lmbda)
+    mu, lmbda = lame_parameters(plane_strain, E, nu)
+    gdim = mesh.geometry.dim
+    sigma = sigma_func(mu, lmbda, gdim)
 
     # Nitche parameters and variables
     theta = nitsche_parameters.get("theta", 1)
@@ -89,8 +90,8 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     assert facet_marker.dim == mesh.topology.dim - 1
 
     # Outward unit normal of plane
-    n_vec = np.zeros(mesh.geometry.dim)
-    n_vec[mesh.geometry.dim - 1] = 1
+    n_vec = np.zeros(gdim)
+    n_vec[gdim - 1] = 1
 
     # Setup function space and functions used in Jacobian and residual formulation
     V = _fem.VectorFunctionSpace(mesh, ("Lagrange", 1))
@@ -111,9 +112,7 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
         ds = ufl.Measure("ds", domain=mesh, subdomain_data=facet_marker)
         h = ufl.Circumradius(mesh)
         n = ufl.FacetNormal(mesh)
-        disp_vec = np.zeros(mesh.geometry.dim)
-        disp_vec[mesh.geometry.dim - 1] = vertical_displacement
-        u_D = ufl.as_vector(disp_vec)
+        u_D = ufl.as_vector([0] * (gdim - 1) + [vertical_displacement])
         F += - ufl.inner(sigma(u) * n, v) * ds(dirichlet_value)\
              - theta * ufl.inner(sigma(v) * n, u - u_D) * \
             ds(dirichlet_value) + E * gamma / h * ufl.inner(u - u_D, v) * ds(dirichlet_value)
@@ -132,9 +131,9 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     # Compute coefficients for mu and lambda as DG-0 functions
     V2 = _fem.FunctionSpace(mesh, ("DG", 0))
     lmbda2 = _fem.Function(V2)
-    lmbda2.interpolate(lambda x: np.full((1, x.shape[1]), lmbda))
+    lmbda2.x.array[:] = lmbda
     mu2 = _fem.Function(V2)
-    mu2.interpolate(lambda x: np.full((1, x.shape[1]), mu))
+    mu2.x.array[:] = mu
 
     # Compute integral entities on exterior facets (cell_index, local_index)
     bottom_facets = facet_marker.find(contact_value)
@@ -171,7 +170,8 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
                                                     V._cpp_object, quadrature_degree=quadrature_degree)
 
     def assemble_residual(x, b, cf):
-        u.vector[:] = x.array
+        x.copy(u.vector)
+        u.vector.ghostUpdate(addv=_PETSc.InsertMode.INSERT, mode=_PETSc.ScatterMode.FORWARD)
         u_packed = dolfinx_contact.cpp.pack_coefficient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
         grad_u_packed = dolfinx_contact.cpp.pack_gradient_quadrature(
             u._cpp_object, quadrature_degree, integral_entities)
@@ -186,7 +186,8 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     kernel_J = dolfinx_contact.cpp.generate_rigid_surface_kernel(V._cpp_object, dolfinx_contact.Kernel.Jac, q_rule)
 
     def assemble_jacobian(x, a_mat, cf):
-        u.vector[:] = x.array
+        x.copy(u.vector)
+        u.vector.ghostUpdate(addv=_PETSc.InsertMode.INSERT, mode=_PETSc.ScatterMode.FORWARD)
         u_packed = dolfinx_contact.cpp.pack_coefficient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
         grad_u_packed = dolfinx_contact.cpp.pack_gradient_quadrature(
             u._cpp_object, quadrature_degree, integral_entities)
@@ -213,7 +214,7 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     solver.A.setNearNullSpace(null_space)
 
     def _u_initial(x):
-        values = np.zeros((mesh.geometry.dim, x.shape[1]))
+        values = np.zeros((gdim, x.shape[1]))
         values[-1] = -0.01 - plane_loc
         return values
 
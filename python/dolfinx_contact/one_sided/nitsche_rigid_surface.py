@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier:    MIT
 
+import hashlib
 from typing import Tuple, Dict
 
 import dolfinx.common as _common
@@ -17,8 +18,8 @@ import ufl
 from petsc4py import PETSc as _PETSc
 
 import dolfinx_contact.cpp
-from dolfinx_contact.helpers import (R_minus, epsilon, lame_parameters,
-                                     rigid_motions_nullspace, sigma_func)
+from dolfinx_contact.helpers import (R_minus, dR_minus, epsilon, lame_parameters,
+                                     rigid_motions_nullspace, sigma_func, tag_groups)
 
 
 def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int, int, int, int],
@@ -77,10 +78,9 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
     plane_strain = physical_parameters.get("strain", False)
     E = physical_parameters.get("E", 1e3)
     nu = physical_parameters.get("nu", 0.1)
-    mu_func, lambda_func = lame_parameters(plane_strain)
-    mu = mu_func(E, nu)
-    lmbda = lambda_func(E, nu)
-    sigma = sigma_func(mu, lmbda)
+    mu, lmbda = lame_parameters(plane_strain, E, nu)
+    gdim = mesh.geometry.dim
+    sigma = sigma_func(mu, lmbda, gdim)
 
     # Nitsche parameters and variables
     theta = nitsche_parameters.get("theta", 1)
@@ -90,7 +90,9 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
     (facet_marker, dirichlet_value_elastic, contact_value_elastic, contact_value_rigid,
      dirichlet_value_rigid) = mesh_data
     assert facet_marker.dim == mesh.topology.dim - 1
-    gdim = mesh.geometry.dim
+    # Bucket the tagged facets once instead of one find() scan per value
+    facet_groups = tag_groups(facet_marker)
+    no_facets = np.empty(0, dtype=np.int32)
 
     # Setup function space and functions used in Jacobian and residual formulation
     V = _fem.VectorFunctionSpace(mesh, ("Lagrange", 1))
@@ -111,9 +113,7 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
     # Nitsche for Dirichlet, another theta-scheme.
     # https://doi.org/10.1016/j.cma.2018.05.024
     if nitsche_bc:
-        disp_vec = np.zeros(gdim)
-        disp_vec[gdim - 1] = vertical_displacement
-        u_D = ufl.as_vector(disp_vec)
+        u_D = ufl.as_vector([0] * (gdim - 1) + [vertical_displacement])
         F += - ufl.inner(sigma(u) * n, v) * ds(dirichlet_value_elastic)\
              - theta * ufl.inner(sigma(v) * n, u - u_D) * \
             ds(dirichlet_value_elastic) + E * gamma / h * ufl.inner(u - u_D, v) * ds(dirichlet_value_elastic)
@@ -123,8 +123,7 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
             ds(dirichlet_value_elastic) + E * gamma / h * ufl.inner(du, v) * ds(dirichlet_value_elastic)
 
         # Nitsche bc for rigid plane
-        disp_plane = np.zeros(gdim)
-        u_D_plane = ufl.as_vector(disp_plane)
+        u_D_plane = ufl.as_vector([0] * gdim)
         F += - ufl.inner(sigma(u) * n, v) * ds(dirichlet_value_rigid)\
              - theta * ufl.inner(sigma(v) * n, u - u_D_plane) * \
             ds(dirichlet_value_rigid) + E * gamma / h * ufl.inner(u - u_D_plane, v) * ds(dirichlet_value_rigid)
@@ -135,8 +134,8 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
     else:
         # strong Dirichlet boundary conditions
         def _u_D(x):
-            values = np.zeros((mesh.geometry.dim, x.shape[1]))
-            values[mesh.geometry.dim - 1] = vertical_displacement
+            values = np.zeros((gdim, x.shape[1]))
+            values[gdim - 1] = vertical_displacement
             return values
         tdim = mesh.topology.dim
         u_D = _fem.Function(V)
@@ -144,12 +143,12 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
         u_D.name = "u_D"
         u_D.x.scatter_forward()
         dirichlet_dofs = _fem.locate_dofs_topological(
-            V, tdim - 1, facet_marker.find(dirichlet_value_elastic))
+            V, tdim - 1, facet_groups.get(dirichlet_value_elastic, no_facets))
         bc = _fem.dirichletbc(u_D, dirichlet_dofs)
         bcs = [bc]
         # Dirichlet boundary conditions for rigid plane
         dirichlet_dofs_plane = _fem.locate_dofs_topological(
-            V, tdim - 1, facet_marker.find(dirichlet_value_rigid))
+            V, tdim - 1, facet_groups.get(dirichlet_value_rigid, no_facets))
         u_D_plane = _fem.Function(V)
         with u_D_plane.vector.localForm() as loc:
             loc.set(0)
@@ -157,7 +156,7 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
         bcs.append(bc_plane)
 
     # Create contact class
-    contact_facets = facet_marker.find(contact_value_elastic)
+    contact_facets = facet_groups.get(contact_value_elastic, no_facets)
     data = np.array([contact_value_elastic, contact_value_rigid], dtype=np.int32)
     offsets = np.array([0, 2], dtype=np.int32)
     surfaces = create_adjacencylist(data, offsets)
@@ -166,35 +165,57 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
                                           V._cpp_object, quadrature_degree=1)
 
     # Create gap function
-    gdim = mesh.geometry.dim
     fdim = mesh.topology.dim - 1
     mesh_geometry = mesh.geometry.x
     contact.create_distance_map(0)
     lookup = contact.facet_map(0)
-    master_bbox = _geometry.BoundingBoxTree(mesh, fdim, contact_facets)
-    midpoint_tree = _geometry.create_midpoint_tree(mesh, fdim, contact_facets)
+    # The trees depend on the mesh geometry and the contact facets, so
+    # cache them on the mesh keyed by the facets and a fingerprint of the
+    # coordinates, and reuse them when the solver is called repeatedly
+    # (load increments, parameter sweeps) on the same setup. The
+    # fingerprint guards against in-place coordinate updates such as
+    # update_geometry between calls
+    tree_cache = getattr(mesh, "_contact_tree_cache", None)
+    if tree_cache is None:
+        tree_cache = {}
+        mesh._contact_tree_cache = tree_cache
+    geometry_fingerprint = hashlib.sha1(mesh_geometry.tobytes()).digest()
+    tree_key = (fdim, contact_facets.tobytes(), geometry_fingerprint)
+    if tree_key not in tree_cache:
+        tree_cache[tree_key] = (_geometry.BoundingBoxTree(mesh, fdim, contact_facets),
+                                _geometry.create_midpoint_tree(mesh, fdim, contact_facets))
+    master_bbox, midpoint_tree = tree_cache[tree_key]
+    # Constant-time facet -> position lookup for indexing into facet_map(0)
+    facet_to_index = {int(facet): i for i, facet in enumerate(contact_facets)}
 
     # This function returns Pi(x) - x, where Pi(x) is the closest point projection
     def gap(x):
-        dist_vec_array = np.zeros((gdim, x.shape[1]))
-        # Find closest facet to point x
+        num_points = x.shape[1]
+        dist_vec_array = np.zeros((gdim, num_points))
+        # Find closest facet to all points in one batched query
         facets = _geometry.compute_closest_entity(master_bbox, midpoint_tree, mesh, np.transpose(x))
-        for i in range(x.shape[1]):
-            xi = x[:, i]
-            facet = facets[i]
-            # Compute distance between point and closest facet
-            index = np.argwhere(np.array(contact_facets) == facet)[0, 0]
-            facet_geometry = _cpp.mesh.entities_to_geometry(mesh._cpp_object, fdim, [facet], False)
-            coords0 = mesh_geometry[facet_geometry][0]
-            R = np.linalg.norm(_cpp.geometry.compute_distance_gjk(coords0, xi))
-            # If point on a facet in contact surface (i.e., if distance between point and closest
-            # facet is 0), use contact.facet_map(0) to find closest facet on rigid surface and
-            # compute distance vector
-            if np.isclose(R, 0):
-                facet_2 = lookup.links(index)[0]
-                facet2_geometry = _cpp.mesh.entities_to_geometry(mesh._cpp_object, fdim, [facet_2], False)
-                coords = mesh_geometry[facet2_geometry][0]
-                dist_vec = _cpp.geometry.compute_distance_gjk(coords, xi)
+        # Fetch the geometry of all closest facets in a single call instead
+        # of one entities_to_geometry round-trip per point
+        unique_facets, inverse = np.unique(facets, return_inverse=True)
+        facet_geometry = _cpp.mesh.entities_to_geometry(mesh._cpp_object, fdim, unique_facets, False)
+        facet_coords = mesh_geometry[facet_geometry]
+        # Compute distance between each point and its closest facet. Points
+        # on a facet of the contact surface (zero distance) get a distance
+        # vector to the rigid surface below; all others keep a zero gap
+        R = np.array([np.linalg.norm(_cpp.geometry.compute_distance_gjk(facet_coords[inverse[i]], x[:, i]))
+                      for i in range(num_points)])
+        on_surface = np.flatnonzero(np.isclose(R, 0))
+        if len(on_surface) > 0:
+            # Use contact.facet_map(0) to find the closest facet on the rigid
+            # surface for each contact point, again fetching the geometry of
+            # all of them at once
+            facets_2 = np.array([lookup.links(facet_to_index[int(facets[i])])[0]
+                                 for i in on_surface], dtype=np.int32)
+            unique_facets_2, inverse_2 = np.unique(facets_2, return_inverse=True)
+            facet2_geometry = _cpp.mesh.entities_to_geometry(mesh._cpp_object, fdim, unique_facets_2, False)
+            facet2_coords = mesh_geometry[facet2_geometry]
+            for k, i in enumerate(on_surface):
+                dist_vec = _cpp.geometry.compute_distance_gjk(facet2_coords[inverse_2[k]], x[:, i])
                 dist_vec_array[: gdim, i] = dist_vec[: gdim]
         return dist_vec_array
 
@@ -204,9 +225,7 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
 
     # Normal vector pointing into plane (but outward of the body coming into contact)
     # Similar to computing the normal by finding the gap vector between two meshes
-    n_vec = np.zeros(mesh.geometry.dim)
-    n_vec[mesh.geometry.dim - 1] = -1
-    n_2 = ufl.as_vector(n_vec)  # Normal of plane (projection onto other body)
+    n_2 = ufl.as_vector([0] * (gdim - 1) + [-1])  # Normal of plane (projection onto other body)
 
     # Define sigma_n
     def sigma_n(v):
@@ -220,7 +239,7 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
         (theta * sigma_n(v) - gamma * ufl.dot(v, n_2)) * ds(contact_value_elastic)
     q = sigma_n(u) + gamma * (ufl.dot(g_vec, n_2) - ufl.dot(u, n_2))
     J = J - theta / gamma * sigma_n(du) * sigma_n(v) * ds(contact_value_elastic)
-    J += 1 / gamma * 0.5 * (1 - ufl.sign(q)) * (sigma_n(du) - gamma * ufl.dot(du, n_2)) * \
+    J += 1 / gamma * dR_minus(q) * (sigma_n(du) - gamma * ufl.dot(du, n_2)) * \
         (theta * sigma_n(v) - gamma * ufl.dot(v, n_2)) * ds(contact_value_elastic)
 
     # Setup non-linear problem and Newton-solver
@@ -253,10 +272,10 @@ def nitsche_rigid_surface(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTags, int
 
     # Set PETSc options
     opts = _PETSc.Options()
-    opts.prefixPush(option_prefix)
-    for k, v in petsc_options.items():
-        opts[k] = v
-    opts.prefixPop()
+    # Insert all options in one call; note insertString does not honour
+    # prefixPush, so the prefix is baked into the option names
+    opts.insertString(" ".join(f"-{option_prefix}{k}" if v is None else f"-{option_prefix}{k} {v}"
+                               for k, v in petsc_options.items()))
     ksp.setFromOptions()
 
     dofs_global = V.dofmap.index_map_bs * V.dofmap.index_map.size_global
@@ -12,6 +12,7 @@ import dolfinx.mesh as _mesh
 import numpy as np
 import ufl
 from dolfinx.graph import create_adjacencylist
+from petsc4py import PETSc as _PETSc
 
 import dolfinx_contact
 import dolfinx_contact.cpp
@@ -93,10 +94,8 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
     plane_strain = physical_parameters.get("strain", False)
     E = physical_parameters.get("E", 1e3)
     nu = physical_parameters.get("nu", 0.1)
-    mu_func, lambda_func = lame_parameters(plane_strain)
-    mu = mu_func(E, nu)
-    lmbda = lambda_func(E, nu)
-    sigma = sigma_func(mu, lmbda)
+    mu, lmbda = lame_parameters(plane_strain, E, nu)
+    sigma = sigma_func(mu, lmbda, mesh.geometry.dim)
 
     # Nitsche parameters and variables
     theta = nitsche_parameters.get("theta", 1)
@@ -127,9 +126,7 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
         h = ufl.CellDiameter(mesh)
         n = ufl.FacetNormal(mesh)
 
-        disp_vec = np.zeros(gdim)
-        disp_vec[gdim - 1] = vertical_displacement
-        u_D = ufl.as_vector(disp_vec)
+        u_D = ufl.as_vector([0] * (gdim - 1) + [vertical_displacement])
         F += - ufl.inner(sigma(u) * n, v) * ds(dirichlet_value_elastic)\
              - theta * ufl.inner(sigma(v) * n, u - u_D) * \
             ds(dirichlet_value_elastic) + E * gamma / h * ufl.inner(u - u_D, v) * ds(dirichlet_value_elastic)
@@ -139,8 +136,7 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
             ds(dirichlet_value_elastic) + E * gamma / h * ufl.inner(du, v) * ds(dirichlet_value_elastic)
 
         # Nitsche bc for rigid plane
-        disp_plane = np.zeros(gdim)
-        u_D_plane = ufl.as_vector(disp_plane)
+        u_D_plane = ufl.as_vector([0] * gdim)
         F += - ufl.inner(sigma(u) * n, v) * ds(dirichlet_value_rigid)\
              - theta * ufl.inner(sigma(v) * n, u - u_D_plane) * \
             ds(dirichlet_value_rigid) + E * gamma / h * ufl.inner(u - u_D_plane, v) * ds(dirichlet_value_rigid)
@@ -159,9 +155,9 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
     # Compute coefficients for mu and lambda as DG-0 functions
     V2 = _fem.FunctionSpace(mesh, ("DG", 0))
     lmbda2 = _fem.Function(V2)
-    lmbda2.interpolate(lambda x: np.full((1, x.shape[1]), lmbda))
+    lmbda2.x.array[:] = lmbda
     mu2 = _fem.Function(V2)
-    mu2.interpolate(lambda x: np.full((1, x.shape[1]), mu))
+    mu2.x.array[:] = mu
 
     # Compute integral entities on exterior facets (cell_index, local_index)
     contact_facets = facet_marker.find(contact_value_elastic)
@@ -218,7 +214,8 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
         Function for updating pack coefficients inside the Newton solver.
         As only u is varying withing the Newton solver, we only update it.
         """
-        u.vector[:] = x.array
+        x.copy(u.vector)
+        u.vector.ghostUpdate(addv=_PETSc.InsertMode.INSERT, mode=_PETSc.ScatterMode.FORWARD)
         u_packed = dolfinx_contact.cpp.pack_coefficient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
         grad_u_packed = dolfinx_contact.cpp.pack_gradient_quadrature(
             u._cpp_object, quadrature_degree, integral_entities)
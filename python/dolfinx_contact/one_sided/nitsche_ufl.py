@@ -13,7 +13,7 @@ import numpy as np
 import ufl
 from petsc4py import PETSc as _PETSc
 
-from dolfinx_contact.helpers import (R_minus, epsilon, lame_parameters,
+from dolfinx_contact.helpers import (R_minus, dR_minus, epsilon, lame_parameters,
                                      rigid_motions_nullspace, sigma_func)
 
 __all__ = ["nitsche_ufl"]
@@ -74,10 +74,9 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     plane_strain = physical_parameters.get("strain", False)
     E = physical_parameters.get("E", 1e3)
     nu = physical_parameters.get("nu", 0.1)
-    mu_func, lambda_func = lame_parameters(plane_strain)
-    mu = mu_func(E, nu)
-    lmbda = lambda_func(E, nu)
-    sigma = sigma_func(mu, lmbda)
+    mu, lmbda = lame_parameters(plane_strain, E, nu)
+    gdim = mesh.geometry.dim
+    sigma = sigma_func(mu, lmbda, gdim)
 
     # Nitche parameters and variables
     theta = nitsche_parameters.get("theta", 1)
@@ -88,9 +87,7 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
 
     # Normal vector pointing into plane (but outward of the body coming into contact)
     # Similar to computing the normal by finding the gap vector between two meshes
-    n_vec = np.zeros(mesh.geometry.dim)
-    n_vec[mesh.geometry.dim - 1] = -1
-    n_2 = ufl.as_vector(n_vec)  # Normal of plane (projection onto other body)
+    n_2 = ufl.as_vector([0] * (gdim - 1) + [-1])  # Normal of plane (projection onto other body)
 
     # Scaled Nitsche parameter
     h = ufl.CellDiameter(mesh)
@@ -98,9 +95,9 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
 
     # Mimicking the plane y=-plane_loc
     x = ufl.SpatialCoordinate(mesh)
-    gap = x[mesh.geometry.dim - 1] + plane_loc
-    g_vec = [i for i in range(mesh.geometry.dim)]
-    g_vec[mesh.geometry.dim - 1] = gap
+    gap = x[gdim - 1] + plane_loc
+    g_vec = [i for i in range(gdim)]
+    g_vec[gdim - 1] = gap
 
     V = _fem.VectorFunctionSpace(mesh, ("Lagrange", 1))
     u = _fem.Function(V)
@@ -110,7 +107,7 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     dx = ufl.Measure("dx", domain=mesh)
     ds = ufl.Measure("ds", domain=mesh, metadata=metadata,
                      subdomain_data=facet_marker)
-    zero = np.asarray([0, ] * mesh.geometry.dim, dtype=np.float64)
+    zero = np.asarray([0, ] * gdim, dtype=np.float64)
     a = ufl.inner(sigma(u), epsilon(v)) * dx
     L = ufl.inner(_fem.Constant(mesh, zero), v) * dx
 
@@ -120,25 +117,30 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     def sigma_n(v):
         # NOTE: Different normals, see summary paper
         return ufl.dot(sigma(v) * n, n_2)
-    F = a - theta / gamma_scaled * sigma_n(u) * sigma_n(v) * ds(bottom_value) - L
-    F += 1 / gamma_scaled * R_minus(sigma_n(u) + gamma_scaled * (gap - ufl.dot(u, n_2))) * \
-        (theta * sigma_n(v) - gamma_scaled * ufl.dot(v, n_2)) * ds(bottom_value)
 
-    # Compute corresponding Jacobian
+    # Build each UFL subexpression once and reuse it; repeated sigma_n(...)
+    # calls would reconstruct the same expression tree node by node
     du = ufl.TrialFunction(V)
-    q = sigma_n(u) + gamma_scaled * (gap - ufl.dot(u, n_2))
-    J = ufl.inner(sigma(du), epsilon(v)) * ufl.dx - theta / gamma_scaled * sigma_n(du) * sigma_n(v) * ds(bottom_value)
-    J += 1 / gamma_scaled * 0.5 * (1 - ufl.sign(q)) * (sigma_n(du) - gamma_scaled * ufl.dot(du, n_2)) * \
-        (theta * sigma_n(v) - gamma_scaled * ufl.dot(v, n_2)) * ds(bottom_value)
+    sigma_n_u = sigma_n(u)
+    sigma_n_v = sigma_n(v)
+    sigma_n_du = sigma_n(du)
+    q = sigma_n_u + gamma_scaled * (gap - ufl.dot(u, n_2))
+    v_n = theta * sigma_n_v - gamma_scaled * ufl.dot(v, n_2)
+
+    F = a - theta / gamma_scaled * sigma_n_u * sigma_n_v * ds(bottom_value) - L
+    F += 1 / gamma_scaled * R_minus(q) * v_n * ds(bottom_value)
+
+    # Compute corresponding Jacobian
+    J = ufl.inner(sigma(du), epsilon(v)) * ufl.dx - theta / gamma_scaled * sigma_n_du * sigma_n_v * ds(bottom_value)
+    J += 1 / gamma_scaled * dR_minus(q) * (sigma_n_du - gamma_scaled * ufl.dot(du, n_2)) * \
+        v_n * ds(bottom_value)
 
-    assert mesh.geometry.dim == mesh.topology.dim
+    assert gdim == mesh.topology.dim
 
     # Nitsche for Dirichlet, another theta-scheme.
     # https://doi.org/10.1016/j.cma.2018.05.024
     if nitsche_bc:
-        disp_vec = np.zeros(mesh.geometry.dim)
-        disp_vec[mesh.geometry.dim - 1] = vertical_displacement
-        u_D = ufl.as_vector(disp_vec)
+        u_D = ufl.as_vector([0] * (gdim - 1) + [vertical_displacement])
         F += - ufl.inner(sigma(u) * n, v) * ds(top_value)\
             - theta * ufl.inner(sigma(v) * n, u - u_D) * \
             ds(top_value) + gamma_scaled / h * ufl.inner(u - u_D, v) * ds(top_value)
@@ -149,8 +151,8 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     else:
         # strong Dirichlet boundary conditions
         def _u_D(x):
-            values = np.zeros((mesh.geometry.dim, x.shape[1]))
-            values[mesh.geometry.dim - 1] = vertical_displacement
+            values = np.zeros((gdim, x.shape[1]))
+            values[gdim - 1] = vertical_displacement
             return values
         u_D = _fem.Function(V)
         u_D.interpolate(_u_D)
@@ -192,7 +194,7 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     solver.relaxation_parameter = newton_options.get("relaxation_parameter", 0.8)
 
     def _u_initial(x):
-        values = np.zeros((mesh.geometry.dim, x.shape[1]))
+        values = np.zeros((gdim, x.shape[1]))
         values[-1] = -0.01 - plane_loc
         return values
 
@@ -206,10 +208,10 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
 
     # Set PETSc options
     opts = _PETSc.Options()
-    opts.prefixPush(option_prefix)
-    for k, v in petsc_options.items():
-        opts[k] = v
-    opts.prefixPop()
+    # Insert all options in one call; note insertString does not honour
+    # prefixPush, so the prefix is baked into the option names
+    opts.insertString(" ".join(f"-{option_prefix}{k}" if v is None else f"-{option_prefix}{k} {v}"
+                               for k, v in petsc_options.items()))
     ksp.setFromOptions()
 
     # Solve non-linear problem
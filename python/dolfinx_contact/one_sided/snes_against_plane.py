@@ -63,10 +63,9 @@ def snes_solver(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     plane_strain = physical_parameters.get("strain", False)
     E = physical_parameters.get("E", 1e3)
     nu = physical_parameters.get("nu", 0.1)
-    mu_func, lambda_func = lame_parameters(plane_strain)
-    mu = mu_func(E, nu)
-    lmbda = lambda_func(E, nu)
-    sigma = sigma_func(mu, lmbda)
+    mu, lmbda = lame_parameters(plane_strain, E, nu)
+    gdim = mesh.geometry.dim
+    sigma = sigma_func(mu, lmbda, gdim)
 
     (facet_marker, top_value, _) = mesh_data
 
@@ -86,7 +85,7 @@ def snes_solver(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     u = _fem.Function(V)
     v = ufl.TestFunction(V)
     dx = ufl.Measure("dx", domain=mesh)
-    zero = np.asarray([0, ] * mesh.geometry.dim, dtype=np.float64)
+    zero = np.asarray([0, ] * gdim, dtype=np.float64)
     F = ufl.inner(sigma(u), epsilon(v)) * dx - \
         ufl.inner(_fem.Constant(mesh, zero), v) * dx
 
@@ -97,12 +96,12 @@ def snes_solver(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     # # Compute first variation of Pi (directional derivative about u in the direction of v)
     # # Yields same F as above if penalty = 0 and body force 0
     # F = ufl.derivative(Pi, u, v)
-    assert mesh.topology.dim == mesh.geometry.dim
+    assert mesh.topology.dim == gdim
 
     # Dirichlet boundary conditions
     def _u_D(x):
-        values = np.zeros((mesh.geometry.dim, x.shape[1]))
-        values[mesh.geometry.dim - 1] = vertical_displacement
+        values = np.zeros((gdim, x.shape[1]))
+        values[gdim - 1] = vertical_displacement
         return values
     u_D = _fem.Function(V)
     u_D.interpolate(_u_D)
@@ -122,21 +121,21 @@ def snes_solver(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     # The displacement u must be such that the current configuration x+u
     # remains in the box [xmin = -inf,xmax = inf] x [ymin = -g,ymax = inf]
     # inf replaced by large number for implementation
-    lims = np.zeros(2 * mesh.geometry.dim)
-    for i in range(mesh.geometry.dim):
+    lims = np.zeros(2 * gdim)
+    for i in range(gdim):
         lims[2 * i] = -1e7
         lims[2 * i + 1] = 1e7
     lims[-2] = -plane_loc
 
     def _constraint_u(x):
-        values = np.zeros((mesh.geometry.dim, x.shape[1]))
-        for i in range(mesh.geometry.dim):
+        values = np.zeros((gdim, x.shape[1]))
+        for i in range(gdim):
             values[i] = lims[2 * i + 1] - x[i]
         return values
 
     def _constraint_l(x):
-        values = np.zeros((mesh.geometry.dim, x.shape[1]))
-        for i in range(mesh.geometry.dim):
+        values = np.zeros((gdim, x.shape[1]))
+        for i in range(gdim):
             values[i] = lims[2 * i] - x[i]
         return values
 
@@ -148,6 +147,12 @@ def snes_solver(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     # Create LHS matrix and RHS vector
     b = _la.create_petsc_vector(V.dofmap.index_map, V.dofmap.index_map_bs)
     J = _fem.petsc.create_matrix(problem.a)
+    # Keep the nonzero pattern when the matrix is zeroed between Jacobian
+    # evaluations; the sparsity never changes, only the contact-set values,
+    # so the CSR structure should not be freed and reallocated each Newton
+    # iteration. How often the Jacobian is rebuilt at all is left to PETSc
+    # via the native -snes_lag_jacobian option
+    J.setOption(_PETSc.Mat.Option.KEEP_NONZERO_PATTERN, True)
 
     # Create semismooth Newton solver (SNES)
     snes = _PETSc.SNES().create()
@@ -174,14 +179,14 @@ def snes_solver(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     ksp.setOptionsPrefix(f"snes_ksp_{id(ksp)}")
     opts = _PETSc.Options()
     option_prefix = ksp.getOptionsPrefix()
-    opts.prefixPush(option_prefix)
-    for k, v in petsc_options.items():
-        opts[k] = v
-    opts.prefixPop()
+    # Insert all options in one call; note insertString does not honour
+    # prefixPush, so the prefix is baked into the option names
+    opts.insertString(" ".join(f"-{option_prefix}{k}" if v is None else f"-{option_prefix}{k} {v}"
+                               for k, v in petsc_options.items()))
     ksp.setFromOptions()
 
     def _u_initial(x):
-        values = np.zeros((mesh.geometry.dim, x.shape[1]))
+        values = np.zeros((gdim, x.shape[1]))
         values[-1] = -0.01 - plane_loc
         return values
 
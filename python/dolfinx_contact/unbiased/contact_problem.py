@@ -5,6 +5,7 @@ import numpy as np
 import numpy.typing as npt
 import ufl
 from dolfinx.cpp.graph import AdjacencyList_int32
+from petsc4py import PETSc as _PETSc
 
 import dolfinx_contact
 import dolfinx_contact.cpp
@@ -138,14 +139,22 @@ def create_contact_solver(ufl_form: ufl.Form, u: fem.Function,
     h = ufl.CellDiameter(mesh)
     n = ufl.FacetNormal(mesh)
 
+    # Wrap the Nitsche parameters in Constants. The generated code is then
+    # independent of their values, so FFCx compiles the form once and the JIT
+    # cache is hit on subsequent calls in parameter sweeps over gamma/theta
+    gamma_c = fem.Constant(mesh, _PETSc.ScalarType(gamma))
+    theta_c = fem.Constant(mesh, _PETSc.ScalarType(theta))
+
     # Integration measure and ufl part of linear/bilinear form
     ds = ufl.Measure("ds", domain=mesh, subdomain_data=markers[1])
 
-    # ufl part of contact
-    for contact_pair in contact_pairs:
-        surface_value = int(contact_surfaces.links(0)[contact_pair[0]])
-        ufl_form += - 0.5 * theta * h / gamma * ufl.inner(sigma(u) * n, sigma(v) * n) * \
-            ds(surface_value)
+    # ufl part of contact. The integrand is identical on every puppet
+    # surface, so integrate it with a single multi-subdomain measure; FFCx
+    # then generates one integration kernel instead of one per surface
+    surface_values = tuple(int(contact_surfaces.links(0)[contact_pair[0]])
+                           for contact_pair in contact_pairs)
+    ufl_form += - 0.5 * theta_c * h / gamma_c * ufl.inner(sigma(u) * n, sigma(v) * n) * \
+        ds(surface_values)
     F = ufl.replace(ufl_form, {u: u + du})
     J = ufl.derivative(F, du, w)
 
@@ -169,43 +178,43 @@ def create_contact_solver(ufl_form: ufl.Form, u: fem.Function,
     # pack constants
     consts = np.array([gamma, theta], dtype=np.float64)
 
-    # Pack material parameters mu and lambda on each contact surface
-    with common.Timer("~Contact: Interpolate coeffs (mu, lmbda)"):
-        V2 = fem.FunctionSpace(mesh, ("DG", 0))
-        lmbda2 = fem.Function(V2)
-        lmbda2.interpolate(lambda x: np.full((1, x.shape[1]), lmbda))
-        mu2 = fem.Function(V2)
-        mu2.interpolate(lambda x: np.full((1, x.shape[1]), mu))
-        fric_coeff = fem.Function(V2)
-        fric_coeff.interpolate(lambda x: np.full((1, x.shape[1]), s))
-
     # Retrieve active entities
     entities = []
     with common.Timer("~Contact: Compute active entities"):
         for pair in contact_pairs:
             entities.append(contact.active_entities(pair[0]))
 
-    # Pack material parameters
-    material = []
-    with common.Timer("~Contact: Pack coeffs (mu, lmbda"):
-        for i in range(len(contact_pairs)):
-            material.append(np.hstack([dolfinx_contact.cpp.pack_coefficient_quadrature(
-                mu2._cpp_object, 0, entities[i]),
-                dolfinx_contact.cpp.pack_coefficient_quadrature(
-                lmbda2._cpp_object, 0, entities[i]),
-                dolfinx_contact.cpp.pack_coefficient_quadrature(
-                fric_coeff._cpp_object, 0, entities[i])]))
-
     # Pack celldiameter on each surface
     h_packed = []
     with common.Timer("~Contact: Compute and pack celldiameter"):
+        V2 = fem.FunctionSpace(mesh, ("DG", 0))
         surface_cells = np.unique(np.hstack([entities[i][:, 0] for i in range(len(contact_pairs))]))
         h_int = fem.Function(V2)
         expr = fem.Expression(h, V2.element.interpolation_points())
         h_int.interpolate(expr, surface_cells)
+        # Pack all pairs in one call and hand out per-pair views of the
+        # result instead of allocating one packed array per surface
+        all_entities = np.vstack(entities)
+        h_all = dolfinx_contact.cpp.pack_coefficient_quadrature(
+            h_int._cpp_object, 0, all_entities)
+        offset = 0
+        for i in range(len(contact_pairs)):
+            h_packed.append(h_all[offset:offset + entities[i].shape[0]])
+            offset += entities[i].shape[0]
+
+    # mu, lambda and the friction coefficient are spatially constant, so
+    # their packed representation is just the scalar repeated at every
+    # quadrature point. Fill the arrays directly instead of materializing
+    # DG-0 functions and packing them through the quadrature machinery
+    material = []
+    with common.Timer("~Contact: Pack coeffs (mu, lmbda"):
         for i in range(len(contact_pairs)):
-            h_packed.append(dolfinx_contact.cpp.pack_coefficient_quadrature(
-                h_int._cpp_object, 0, entities[i]))
+            num_points = h_packed[i].shape[1]
+            mat = np.empty((entities[i].shape[0], 3 * num_points))
+            mat[:, :num_points] = mu
+            mat[:, num_points:2 * num_points] = lmbda
+            mat[:, 2 * num_points:] = s
+            material.append(mat)
 
     # Concatenate material parameters, h
     const_coeffs = []
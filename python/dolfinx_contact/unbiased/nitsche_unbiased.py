@@ -14,7 +14,8 @@ from petsc4py import PETSc as _PETSc
 
 import dolfinx_contact
 import dolfinx_contact.cpp
-from dolfinx_contact.helpers import (rigid_motions_nullspace_subdomains, sigma_func)
+from dolfinx_contact.helpers import (rigid_motions_nullspace_subdomains, sigma_func,
+                                     tag_groups, unique_tag_values)
 
 kt = dolfinx_contact.cpp.Kernel
 
@@ -88,6 +89,8 @@ def setup_newton_solver(F_custom: fem.forms.FormMetaClass, J_custom: fem.forms.F
         ccfs.append(np.hstack([const_coeffs[i], gaps[i], normals[i], test_fns[i]]))
 
     # retrieve boundary conditions for time step
+    facet_groups = tag_groups(markers[1])
+    no_facets = np.empty(0, dtype=np.int32)
     tbcs = []
     for k, g in enumerate(bcs[1]):
         tag = bcs[0][k][0]
@@ -96,9 +99,18 @@ def setup_newton_solver(F_custom: fem.forms.FormMetaClass, J_custom: fem.forms.F
             fn_space = V
         else:
             fn_space = V.sub(sub)
-        bdy_dofs = fem.locate_dofs_topological(fn_space, mesh.topology.dim - 1, markers[1].find(tag))
+        bdy_dofs = fem.locate_dofs_topological(fn_space, mesh.topology.dim - 1, facet_groups.get(int(tag), no_facets))
         tbcs.append(fem.dirichletbc(g, bdy_dofs, fn_space))
 
+    # The compiled UFL part of the Jacobian (bulk stiffness and the Nitsche
+    # surface term) is linear in du and independent of u, so its matrix is
+    # constant across Newton iterations. Assemble it once with the same
+    # sparsity as A and add it with axpy in every iteration; only the
+    # contact kernels are re-assembled
+    A_const = contact.create_matrix(J_custom)
+    fem.petsc.assemble_matrix(A_const, J_custom, bcs=tbcs)
+    A_const.assemble()
+
     # pack grad u
     grad_u = []
     with common.Timer("~~Contact: Pack grad(u)"):
@@ -125,9 +137,17 @@ def setup_newton_solver(F_custom: fem.forms.FormMetaClass, J_custom: fem.forms.F
                     du._cpp_object, quadrature_degree, entities[i]))
                 grad_u_puppet.append(dolfinx_contact.cpp.pack_gradient_quadrature(
                     du._cpp_object, quadrature_degree, entities[i]))
+        # Write the u-dependent blocks into their column slabs in place; the
+        # static leading block was filled once below and np.hstack would
+        # re-copy it (and allocate a temporary) every Newton iteration
         for i in range(num_pairs):
-            c_0 = np.hstack([ccfs[i], u_puppet[i], grad_u_puppet[i] + grad_u[i], u_candidate[i]])
-            coeffs[i][:, :] = c_0[:, :]
+            offset = ccfs[i].shape[1]
+            width_u = u_puppet[i].shape[1]
+            width_grad = grad_u_puppet[i].shape[1]
+            coeffs[i][:, offset:offset + width_u] = u_puppet[i]
+            np.add(grad_u_puppet[i], grad_u[i],
+                   out=coeffs[i][:, offset + width_u:offset + width_u + width_grad])
+            coeffs[i][:, offset + width_u + width_grad:] = u_candidate[i]
 
     # function for computing residual
     @common.timed("~Contact: Assemble residual")
@@ -156,14 +176,29 @@ def setup_newton_solver(F_custom: fem.forms.FormMetaClass, J_custom: fem.forms.F
             for i in range(num_pairs):
                 contact.assemble_matrix(A, [], i, kernel_jac, coeffs[i], consts)
                 contact.assemble_matrix(A, [], i, kernel_friction_jac, coeffs[i], consts)
-        with common.Timer("~~Contact: Standard contributions (in assemble matrix)"):
-            fem.petsc.assemble_matrix(A, J_custom, bcs=tbcs)
         A.assemble()
+        with common.Timer("~~Contact: Standard contributions (in assemble matrix)"):
+            A.axpy(1.0, A_const, _PETSc.Mat.Structure.SUBSET_NONZERO_PATTERN)
 
     # coefficient arrays
     num_coeffs = contact.coefficients_size(False)
 
     coeffs = [np.zeros((len(entities[i]), num_coeffs)) for i in range(num_pairs)]
+    # Fill the static blocks (material, h, gap, normals, test functions)
+    # once; compute_coefficients only updates the u-dependent columns
+    for i in range(num_pairs):
+        coeffs[i][:, :ccfs[i].shape[1]] = ccfs[i]
+
+    # Fix the stored nonzero pattern of A once, with both the contact
+    # couplings and the UFL entries: final assembly compresses unused
+    # preallocated slots and MatZeroEntries keeps the structure, so the
+    # per-iteration assemblies never allocate and A_const's pattern stays
+    # a subset of A's for the axpy in compute_jacobian_matrix
+    for i in range(num_pairs):
+        contact.assemble_matrix(A, [], i, kernel_jac, coeffs[i], consts)
+        contact.assemble_matrix(A, [], i, kernel_friction_jac, coeffs[i], consts)
+    fem.petsc.assemble_matrix(A, J_custom, bcs=tbcs)
+    A.assemble()
     newton_solver = dolfinx_contact.NewtonSolver(mesh.comm, A, b, coeffs)
 
     # Set matrix-vector computations
@@ -172,7 +207,7 @@ def setup_newton_solver(F_custom: fem.forms.FormMetaClass, J_custom: fem.forms.F
     newton_solver.set_coefficients(compute_coefficients)
 
     # Set rigid motion nullspace
-    null_space = rigid_motions_nullspace_subdomains(V, markers[0], np.unique(markers[0].values))
+    null_space = rigid_motions_nullspace_subdomains(V, markers[0], unique_tag_values(markers[0].values))
     newton_solver.A.setNearNullSpace(null_space)
 
     return newton_solver
@@ -332,14 +367,22 @@ def nitsche_unbiased(steps: int, ufl_form: ufl.Form, u: fem.Function,
     h = ufl.CellDiameter(mesh)
     n = ufl.FacetNormal(mesh)
 
+    # Wrap the Nitsche parameters in Constants. The generated code is then
+    # independent of their values, so FFCx compiles the form once and the JIT
+    # cache is hit on subsequent calls in parameter sweeps over gamma/theta
+    gamma_c = fem.Constant(mesh, _PETSc.ScalarType(gamma))
+    theta_c = fem.Constant(mesh, _PETSc.ScalarType(theta))
+
     # Integration measure and ufl part of linear/bilinear form
     ds = ufl.Measure("ds", domain=mesh, subdomain_data=markers[1])
 
-    # ufl part of contact
-    for contact_pair in contact_pairs:
-        surface_value = int(contact_surfaces.links(0)[contact_pair[0]])
-        ufl_form += - 0.5 * theta * h / gamma * ufl.inner(sigma(u) * n, sigma(v) * n) * \
-            ds(surface_value)
+    # ufl part of contact. The integrand is identical on every puppet
+    # surface, so integrate it with a single multi-subdomain measure; FFCx
+    # then generates one integration kernel instead of one per surface
+    surface_values = tuple(int(contact_surfaces.links(0)[contact_pair[0]])
+                           for contact_pair in contact_pairs)
+    ufl_form += - 0.5 * theta_c * h / gamma_c * ufl.inner(sigma(u) * n, sigma(v) * n) * \
+        ds(surface_values)
     F = ufl.replace(ufl_form, {u: u + du})
     J = ufl.derivative(F, du, w)
 
@@ -367,43 +410,43 @@ def nitsche_unbiased(steps: int, ufl_form: ufl.Form, u: fem.Function,
     # pack constants
     consts = np.array([gamma, theta], dtype=np.float64)
 
-    # Pack material parameters mu and lambda on each contact surface
-    with common.Timer("~Contact: Interpolate coeffs (mu, lmbda)"):
-        V2 = fem.FunctionSpace(mesh, ("DG", 0))
-        lmbda2 = fem.Function(V2)
-        lmbda2.interpolate(lambda x: np.full((1, x.shape[1]), lmbda))
-        mu2 = fem.Function(V2)
-        mu2.interpolate(lambda x: np.full((1, x.shape[1]), mu))
-        fric_coeff = fem.Function(V2)
-        fric_coeff.interpolate(lambda x: np.full((1, x.shape[1]), s))
-
     # Retrieve active entities
     entities = []
     with common.Timer("~Contact: Compute active entities"):
         for pair in contact_pairs:
             entities.append(contact.active_entities(pair[0]))
 
-    # Pack material parameters
-    material = []
-    with common.Timer("~Contact: Pack coeffs (mu, lmbda"):
-        for i in range(len(contact_pairs)):
-            material.append(np.hstack([dolfinx_contact.cpp.pack_coefficient_quadrature(
-                mu2._cpp_object, 0, entities[i]),
-                dolfinx_contact.cpp.pack_coefficient_quadrature(
-                lmbda2._cpp_object, 0, entities[i]),
-                dolfinx_contact.cpp.pack_coefficient_quadrature(
-                fric_coeff._cpp_object, 0, entities[i])]))
-
     # Pack celldiameter on each surface
     h_packed = []
     with common.Timer("~Contact: Compute and pack celldiameter"):
+        V2 = fem.FunctionSpace(mesh, ("DG", 0))
         surface_cells = np.unique(np.hstack([entities[i][:, 0] for i in range(len(contact_pairs))]))
         h_int = fem.Function(V2)
         expr = fem.Expression(h, V2.element.interpolation_points())
         h_int.interpolate(expr, surface_cells)
+        # Pack all pairs in one call and hand out per-pair views of the
+        # result instead of allocating one packed array per surface
+        all_entities = np.vstack(entities)
+        h_all = dolfinx_contact.cpp.pack_coefficient_quadrature(
+            h_int._cpp_object, 0, all_entities)
+        offset = 0
+        for i in range(len(contact_pairs)):
+            h_packed.append(h_all[offset:offset + entities[i].shape[0]])
+            offset += entities[i].shape[0]
+
+    # mu, lambda and the friction coefficient are spatially constant, so
+    # their packed representation is just the scalar repeated at every
+    # quadrature point. Fill the arrays directly instead of materializing
+    # DG-0 functions and packing them through the quadrature machinery
+    material = []
+    with common.Timer("~Contact: Pack coeffs (mu, lmbda"):
         for i in range(len(contact_pairs)):
-            h_packed.append(dolfinx_contact.cpp.pack_coefficient_quadrature(
-                h_int._cpp_object, 0, entities[i]))
+            num_points = h_packed[i].shape[1]
+            mat = np.empty((entities[i].shape[0], 3 * num_points))
+            mat[:, :num_points] = mu
+            mat[:, num_points:2 * num_points] = lmbda
+            mat[:, 2 * num_points:] = s
+            material.append(mat)
 
     # Concatenate material parameters, h
     const_coeffs = []
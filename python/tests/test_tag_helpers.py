@@ -0,0 +1,53 @@
+# SPDX-License-Identifier:   MIT
+
+import numpy as np
+import pytest
+from dolfinx.mesh import create_unit_square, locate_entities_boundary, meshtags
+from mpi4py import MPI
+
+from dolfinx_contact.helpers import facet_tag_data, tag_groups, unique_tag_values
+
+
+def test_facet_tag_data():
+    tagged_facets = [(np.array([5, 1, 9], dtype=np.int32), 2),
+                     (np.array([], dtype=np.int32), 3),
+                     (np.array([4, 0, 7], dtype=np.int32), 6)]
+    indices, values = facet_tag_data(tagged_facets)
+
+    # Naive construction the helper replaces
+    ref_indices = np.hstack([facets for facets, _ in tagged_facets]).astype(np.int32)
+    ref_values = np.hstack([np.full(len(facets), value, dtype=np.int32)
+                            for facets, value in tagged_facets])
+    order = np.argsort(ref_indices)
+    assert np.array_equal(indices, ref_indices[order])
+    assert np.array_equal(values, ref_values[order])
+    assert indices.dtype == np.int32
+    assert values.dtype == np.int32
+
+
+@pytest.mark.parametrize("values", [
+    np.array([], dtype=np.int32),                 # empty
+    np.array([3, 1, 3, 0, 1], dtype=np.int32),    # bincount fast path
+    np.array([2, -1, 2], dtype=np.int32),         # negative -> np.unique fallback
+    np.array([5000, 2, 5000], dtype=np.int32)])   # large -> np.unique fallback
+def test_unique_tag_values(values):
+    unique = unique_tag_values(values)
+    assert np.array_equal(unique, np.unique(values))
+    assert unique.dtype == values.dtype
+
+
+def test_tag_groups():
+    mesh = create_unit_square(MPI.COMM_WORLD, 8, 8)
+    fdim = mesh.topology.dim - 1
+    left = locate_entities_boundary(mesh, fdim, lambda x: np.isclose(x[0], 0.0))
+    right = locate_entities_boundary(mesh, fdim, lambda x: np.isclose(x[0], 1.0))
+    indices, values = facet_tag_data([(left, 1), (right, 2)])
+    facet_marker = meshtags(mesh, fdim, indices, values)
+
+    groups = tag_groups(facet_marker)
+    no_facets = np.empty(0, dtype=np.int32)
+    # Equivalent to find() for present, locally absent (in parallel a rank
+    # may own no facets of a tag) and unknown values alike
+    for tag in (1, 2, 3):
+        assert np.array_equal(groups.get(tag, no_facets), facet_marker.find(tag))
+    assert 3 not in groups